@@ -84,6 +84,9 @@ def detect(
     logger.debug(f"Starting detection in {project_path}")
     start_time = time.perf_counter()
 
+    # Resolve the root once; every detector validates manifests against it
+    project_path = project_path.resolve()
+
     # Run all detection strategies
     # Language detection also gathers file scan statistics
     logger.debug("Running language detection...")
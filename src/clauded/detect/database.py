@@ -2,6 +2,8 @@
 
 import json
 import logging
+import os
+import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
@@ -12,8 +14,18 @@ except ModuleNotFoundError:
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from .result import DetectedItem
-from .utils import extract_package_name, is_safe_path, safe_read_text
+from .utils import (
+    extract_package_name,
+    is_safe_path,
+    load_toml,
+    safe_read_text,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +57,18 @@ MONGODB_ORM_ADAPTERS = {
     "mgo",  # Legacy Go driver
 }
 
+# Image-name matchers in priority order: an image naming several databases is
+# classified by the first entry whose substring appears in its base name.
+_IMAGE_DATABASE_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    (db_name, re.compile("|".join(map(re.escape, sorted(images))), re.ASCII))
+    for db_name, images in (
+        ("postgresql", POSTGRES_IMAGES),
+        ("redis", REDIS_IMAGES),
+        ("mysql", MYSQL_IMAGES),
+        ("mongodb", MONGODB_IMAGES),
+    )
+)
+
 ENV_VAR_PATTERNS = {
     "postgresql": {"DATABASE_URL", "POSTGRES_URL", "POSTGRESQL_URL"},
     "redis": {"REDIS_URL", "REDIS_HOST"},
@@ -212,7 +236,7 @@ def parse_docker_compose(project_path: Path) -> list[DetectedItem]:
             continue
 
         try:
-            compose_data = yaml.safe_load(content)
+            compose_data = yaml.load(content, Loader=_YamlLoader)
 
             if not compose_data or not isinstance(compose_data, dict):
                 continue
@@ -232,15 +256,14 @@ def parse_docker_compose(project_path: Path) -> list[DetectedItem]:
                 # Extract image base name (before any colon for tags)
                 image_base = image.split(":")[0].lower()
 
-                db_name = None
-                if any(pattern in image_base for pattern in POSTGRES_IMAGES):
-                    db_name = "postgresql"
-                elif any(pattern in image_base for pattern in REDIS_IMAGES):
-                    db_name = "redis"
-                elif any(pattern in image_base for pattern in MYSQL_IMAGES):
-                    db_name = "mysql"
-                elif any(pattern in image_base for pattern in MONGODB_IMAGES):
-                    db_name = "mongodb"
+                db_name = next(
+                    (
+                        name
+                        for name, pattern in _IMAGE_DATABASE_PATTERNS
+                        if pattern.search(image_base)
+                    ),
+                    None,
+                )
 
                 if db_name:
                     databases.append(
@@ -427,8 +450,7 @@ def detect_orm_adapters(project_path: Path) -> list[DetectedItem]:
     pyproject_file = project_path / "pyproject.toml"
     if pyproject_file.exists() and is_safe_path(pyproject_file, project_path):
         try:
-            with open(pyproject_file, "rb") as f:
-                pyproject_data = tomllib.load(f)
+            pyproject_data = load_toml(pyproject_file)
 
             all_deps = set()
 
@@ -655,8 +677,13 @@ def detect_sqlite_files(project_path: Path) -> list[DetectedItem]:
 
     try:
         # Only check project root, not recursive (avoid false positives)
-        for file_path in project_path.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in sqlite_extensions:
+        with os.scandir(project_path) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                file_path = Path(entry.path)
+                if file_path.suffix.lower() not in sqlite_extensions:
+                    continue
                 if is_safe_path(file_path, project_path):
                     databases.append(
                         DetectedItem(
@@ -8,7 +8,12 @@ from pathlib import Path
 from typing import Literal
 
 from .result import DetectedItem
-from .utils import extract_package_name, is_safe_path, safe_read_text
+from .utils import (
+    extract_package_name,
+    is_safe_path,
+    load_toml,
+    safe_read_text,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -240,8 +245,7 @@ def parse_python_dependencies(project_path: Path) -> list[DetectedItem]:
     pyproject_path = project_path / "pyproject.toml"
     if pyproject_path.exists() and is_safe_path(pyproject_path, project_path):
         try:
-            with open(pyproject_path, "rb") as f:
-                data = tomllib.load(f)
+            data = load_toml(pyproject_path)
 
             project = data.get("project", {})
 
@@ -571,8 +575,7 @@ def parse_rust_dependencies(project_path: Path) -> list[DetectedItem]:
         return items
 
     try:
-        with open(cargo_path, "rb") as f:
-            data = tomllib.load(f)
+        data = load_toml(cargo_path)
 
         # Parse dependencies
         dependencies = data.get("dependencies", {})
@@ -1,7 +1,9 @@
 """Language detection using GitHub Linguist data."""
 
 import logging
+import os
 import re
+from collections.abc import Iterator
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
@@ -121,19 +123,69 @@ def load_linguist_data() -> dict[str, Any]:
         }
 
 
-def _is_in_skip_directory(file_path: Path) -> bool:
-    """Check if file is inside a directory that should be skipped.
+def _iter_project_files(
+    project_path: Path, pruned: list[str] | None = None
+) -> Iterator[Path]:
+    """Yield every file under project_path, walking with os.scandir.
+
+    Like Path.rglob("*"), directory symlinks are not descended into and
+    unreadable directories are skipped. Each entry's type comes from the
+    DirEntry's cached d_type, so non-files cost no extra stat call.
+    Directories named in SKIP_DIRECTORIES are pruned: their contents are
+    never listed.
+
+    Args:
+        project_path: Directory to walk
+        pruned: Optional list that collects the paths of pruned directories
+
+    Yields:
+        Paths of regular files (and symlinks to files) under project_path
+    """
+    pending = [os.fspath(project_path)]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in SKIP_DIRECTORIES:
+                            if pruned is not None:
+                                pruned.append(entry.path)
+                        else:
+                            pending.append(entry.path)
+                    elif entry.is_file():
+                        yield Path(entry.path)
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {directory}: {e}")
+
+
+def _count_files(directory: str) -> int:
+    """Count the files under a pruned directory without classifying them.
+
+    Walks like _iter_project_files (directory symlinks are not descended
+    into, unreadable directories are skipped) but only tallies entries, so
+    pruned trees still show up in files_excluded at the cost of a listing.
 
     Args:
-        file_path: Relative path to check
+        directory: Directory to count
 
     Returns:
-        True if file is in a skip directory, False otherwise
+        Number of regular files (and symlinks to files) under directory
     """
-    for part in file_path.parts:
-        if part in SKIP_DIRECTORIES:
-            return True
-    return False
+    count = 0
+    pending = [directory]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        count += 1
+        except OSError as e:
+            logger.debug(f"Skipping unreadable directory {current}: {e}")
+    return count
 
 
 def _is_excluded_by_vendor(file_path: Path, vendor_patterns: list[str]) -> bool:
@@ -389,8 +441,11 @@ def detect_languages(
         logger.warning(f"Project path does not exist: {project_path}")
         return []
 
+    # Build directories, caches and VCS internals are pruned by the walk; the
+    # files beneath them are counted as excluded once the scan is done.
+    pruned_dirs: list[str] = []
     try:
-        for file_path in project_path.rglob("*"):
+        for file_path in _iter_project_files(project_path, pruned_dirs):
             # Check file limit before processing
             if files_scanned >= MAX_FILE_SCAN_LIMIT:
                 scan_truncated = True
@@ -400,7 +455,10 @@ def detect_languages(
                 )
                 break
 
-            if not file_path.is_file():
+            # Files named like a skip directory (.env, a build script, ...)
+            # are excluded just as the directories are
+            if file_path.name in SKIP_DIRECTORIES:
+                files_excluded += 1
                 continue
 
             # SEC-001: Skip symlinks to prevent exploitation
@@ -411,11 +469,6 @@ def detect_languages(
             try:
                 rel_path = file_path.relative_to(project_path)
 
-                # Skip build directories, caches, and VCS internals
-                if _is_in_skip_directory(rel_path):
-                    files_excluded += 1
-                    continue
-
                 if _is_excluded_by_vendor(rel_path, vendor_patterns):
                     files_excluded += 1
                     continue
@@ -460,6 +513,7 @@ def detect_languages(
 
     except Exception as e:
         logger.warning(f"Error scanning project directory: {e}")
+    files_excluded += sum(_count_files(directory) for directory in pruned_dirs)
 
     results = []
     for lang_name in sorted(language_bytes.keys()):
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Literal
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DetectedLanguage:
     """A detected programming language with confidence and evidence."""
 
@@ -15,7 +15,7 @@ class DetectedLanguage:
     source_files: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VersionSpec:
     """A detected runtime version specification."""
 
@@ -24,7 +24,7 @@ class VersionSpec:
     constraint_type: Literal["exact", "minimum", "range"]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DetectedItem:
     """A detected framework, tool, or database."""
 
@@ -34,7 +34,7 @@ class DetectedItem:
     source_evidence: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScanStats:
     """Statistics from the detection scan."""
 
@@ -44,7 +44,7 @@ class ScanStats:
     scan_truncated: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DetectionResult:
     """Complete detection results for a project."""
 
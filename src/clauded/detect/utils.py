@@ -4,11 +4,22 @@ This module provides common utility functions used across detection modules,
 including security-related path validation and package name extraction.
 """
 
+import codecs
+import copy
+import io
 import logging
+import os
+import tomllib
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Flags for safe_read_text: never follow a final-component symlink (SEC-001)
+# and do not leak the descriptor into child processes
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0) | getattr(os, "O_CLOEXEC", 0)
+
 
 def is_safe_path(file_path: Path, project_root: Path) -> bool:
     """Check if file path is safe to read (SEC-001: Symlink protection).
@@ -19,7 +30,8 @@ def is_safe_path(file_path: Path, project_root: Path) -> bool:
 
     Args:
         file_path: Path to validate
-        project_root: Project root directory
+        project_root: Project root directory (resolved once per detection pass
+            by detect(); a relative or non-canonical root is also accepted)
 
     Returns:
         True if path is safe to read, False otherwise
@@ -29,11 +41,13 @@ def is_safe_path(file_path: Path, project_root: Path) -> bool:
         logger.debug(f"Skipping symlinked file: {file_path}")
         return False
 
-    # Check if resolved path is within project boundary
+    # Check if resolved path is within project boundary. detect() passes an
+    # already-resolved root, which contains the resolved path as-is; any
+    # other root is resolved here before comparing.
     try:
         resolved = file_path.resolve()
-        project_resolved = project_root.resolve()
-        resolved.relative_to(project_resolved)
+        if not resolved.is_relative_to(project_root):
+            resolved.relative_to(project_root.resolve())
         return True
     except ValueError:
         logger.warning(f"File outside project boundary: {file_path}")
@@ -45,6 +59,12 @@ def safe_read_text(
 ) -> str | None:
     """Safely read text file with symlink protection and size limit.
 
+    The file is opened with O_NOFOLLOW, so a symlink swapped in after the
+    is_safe_path check is still refused, and a single os.read of at most
+    `limit` bytes is issued. A multi-byte UTF-8 sequence cut off by the limit
+    is dropped rather than treated as a decoding error; otherwise decoding
+    matches text-mode open() (strict UTF-8, universal newlines).
+
     Args:
         file_path: Path to read
         project_root: Project root directory
@@ -58,9 +78,18 @@ def safe_read_text(
         return None
 
     try:
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read(limit)
-        return content
+        fd = os.open(file_path, _READ_FLAGS)
+        try:
+            data = os.read(fd, limit)
+        finally:
+            os.close(fd)
+        # Same decoding as text-mode open(): strict UTF-8 with universal
+        # newlines. A short read means EOF, so the input is final; a full one
+        # may end mid-sequence, which the decoder then holds back.
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder("utf-8")(), translate=True
+        )
+        return decoder.decode(data, final=len(data) < limit)
     except Exception as e:
         logger.warning(f"Failed to read {file_path}: {e}")
         return None
@@ -92,6 +121,37 @@ def safe_read_bytes(
         return None
 
 
+def load_toml(file_path: Path) -> dict[str, Any]:
+    """Parse a TOML file, reusing the parse for byte-identical content.
+
+    A full detection run reads pyproject.toml from the version, framework
+    and database detectors; the parse is memoized on the file's bytes, so
+    only the read is repeated. Each caller gets its own deep copy of the
+    cached document, which is far cheaper than tomllib re-parsing it.
+
+    Args:
+        file_path: TOML file to parse (callers validate it with is_safe_path)
+
+    Returns:
+        Parsed TOML document
+
+    Raises:
+        OSError: If the file cannot be read
+        tomllib.TOMLDecodeError: If the content is not valid TOML
+    """
+    with open(file_path, "rb") as f:
+        return copy.deepcopy(_parse_toml_bytes(f.read()))
+
+
+@lru_cache(maxsize=16)
+def _parse_toml_bytes(content: bytes) -> dict[str, Any]:
+    """Parse TOML bytes as tomllib.load does; cached by load_toml.
+
+    The result is never handed out directly; load_toml returns copies.
+    """
+    return tomllib.loads(content.decode())
+
+
 def extract_package_name(dep_spec: str, normalize_case: bool = False) -> str:
     """Extract package name from dependency specification string.
 
@@ -12,26 +12,62 @@ except ImportError:
     import tomli as tomllib  # type: ignore[import-not-found, no-redef]
 
 from .result import VersionSpec
-from .utils import is_safe_path, safe_read_text
+from .utils import is_safe_path, load_toml, safe_read_text
 
 logger = logging.getLogger(__name__)
 
 # Version validation patterns (SEC-002: Prevent command injection)
-# These patterns ensure version strings contain only safe characters
+# These patterns ensure version strings contain only safe characters.
+# re.ASCII restricts \d to 0-9, so non-ASCII digits never pass the whitelist.
 VERSION_PATTERNS: dict[str, re.Pattern[str]] = {
     # Python: exact versions, constraints (>=, ~=, <, <=), ranges (>=x,<y)
     "python": re.compile(
         r"^(\d+\.\d+(\.\d+)?|"  # Exact: 3.12, 3.12.0
-        r"[><=~!]+\d+\.\d+(\.\d+)?(,[><=]+\d+\.\d+(\.\d+)?)?)$"
+        r"[><=~!]+\d+\.\d+(\.\d+)?(,[><=]+\d+\.\d+(\.\d+)?)?)$",
+        re.ASCII,
     ),
     # Node: exact, semver ranges, wildcards
-    "node": re.compile(r"^v?\d+(\.\d+)*([.xX*])?$|^\^?\d+(\.\d+)*$|^>=?\d+(\.\d+)*$"),
-    "java": re.compile(r"^\d+(\.\d+)*$"),
-    "kotlin": re.compile(r"^\d+\.\d+(\.\d+)?$"),
-    "rust": re.compile(r"^(stable|nightly|beta)(-\d{4}-\d{2}-\d{2})?$|^\d+\.\d+\.\d+$"),
-    "go": re.compile(r"^\d+\.\d+(\.\d+)?$"),
+    "node": re.compile(
+        r"^v?\d+(\.\d+)*([.xX*])?$|^\^?\d+(\.\d+)*$|^>=?\d+(\.\d+)*$", re.ASCII
+    ),
+    "java": re.compile(r"^\d+(\.\d+)*$", re.ASCII),
+    "kotlin": re.compile(r"^\d+\.\d+(\.\d+)?$", re.ASCII),
+    "rust": re.compile(
+        r"^(stable|nightly|beta)(-\d{4}-\d{2}-\d{2})?$|^\d+\.\d+\.\d+$", re.ASCII
+    ),
+    "go": re.compile(r"^\d+\.\d+(\.\d+)?$", re.ASCII),
 }
 
+# Constraint classification (see _classify_constraint_type)
+_EXACT_VERSION_RE = re.compile(r"^\d+(\.\d+)*$", re.ASCII)
+_COMPARISON_PREFIX_RE = re.compile(r"^(>=|<=|>|<)")
+_RANGE_PREFIX_RE = re.compile(r"^(\^|~|=~|!=|~=)")
+
+# Manifest extraction patterns, compiled once at import
+# setup.py: python_requires='>=3.10' or python_requires=">=3.10"
+_SETUP_PY_REQUIRES_RE = re.compile(r"python_requires\s*=\s*['\"]([^'\"]+)['\"]")
+_POM_COMPILER_SOURCE_RE = re.compile(
+    r"<maven\.compiler\.source>(\d+(?:\.\d+)*)</maven\.compiler\.source>", re.ASCII
+)
+_GRADLE_SOURCE_COMPAT_RE = re.compile(
+    r"sourceCompatibility\s*=\s*['\"]?(\d+(?:\.\d+)*)['\"]?", re.ASCII
+)
+# build.gradle.kts Java version, in lookup order: sourceCompatibility,
+# jvmToolchain(N), then JavaLanguageVersion.of(N) in a toolchain block
+_KTS_JAVA_VERSION_RES = (
+    re.compile(r"sourceCompatibility\s*=\s*JavaVersion\.VERSION_(\d+)", re.ASCII),
+    re.compile(r"jvmToolchain\s*\(\s*(\d+)\s*\)", re.ASCII),
+    re.compile(r"JavaLanguageVersion\.of\s*\(\s*(\d+)\s*\)", re.ASCII),
+)
+# build.gradle.kts Kotlin plugin: kotlin("jvm") or id("org.jetbrains.kotlin.jvm")
+_KOTLIN_PLUGIN_VERSION_RES = (
+    re.compile(r'kotlin\s*\(\s*["\']jvm["\']\s*\)\s+version\s+["\']([^"\']+)["\']'),
+    re.compile(
+        r'id\s*\(\s*["\']org\.jetbrains\.kotlin\.jvm["\']\s*\)\s+'
+        r'version\s+["\']([^"\']+)["\']'
+    ),
+)
+
 
 def _validate_version(version: str, runtime: str) -> bool:
     """Validate version string against runtime-specific pattern.
@@ -127,15 +163,15 @@ def _classify_constraint_type(version: str) -> Literal["exact", "minimum", "rang
     """
     version = version.strip()
 
-    if re.match(r"^\d+(\.\d+)*$", version):
+    if _EXACT_VERSION_RE.match(version):
         return "exact"
 
-    if re.match(r"^(>=|<=|>|<)", version):
+    if _COMPARISON_PREFIX_RE.match(version):
         if "," in version or " " in version.replace(">=", "").replace("<=", ""):
             return "range"
         return "minimum"
 
-    if re.match(r"^(\^|~|=~|!=|~=)", version):
+    if _RANGE_PREFIX_RE.match(version):
         return "range"
 
     if "||" in version or "|" in version:
@@ -199,8 +235,7 @@ def parse_python_version(project_path: Path) -> VersionSpec | None:
     pyproject_file = project_path / "pyproject.toml"
     if pyproject_file.exists() and is_safe_path(pyproject_file, project_path):
         try:
-            with open(pyproject_file, "rb") as f:
-                data = tomllib.load(f)
+            data = load_toml(pyproject_file)
             requires_python = data.get("project", {}).get("requires-python")
             if requires_python:
                 requires_python = _normalize_version(requires_python)
@@ -221,11 +256,7 @@ def parse_python_version(project_path: Path) -> VersionSpec | None:
         content = safe_read_text(setup_py_file, project_path)
         if content:
             try:
-                # Match python_requires='>=3.10' or python_requires=">=3.10"
-                match = re.search(
-                    r"python_requires\s*=\s*['\"]([^'\"]+)['\"]",
-                    content,
-                )
+                match = _SETUP_PY_REQUIRES_RE.search(content)
                 if match:
                     python_requires = _normalize_version(match.group(1))
                     if not _validate_version(python_requires, "python"):
@@ -377,10 +408,7 @@ def parse_java_version(project_path: Path) -> VersionSpec | None:
         content = safe_read_text(pom_file, project_path)
         if content:
             try:
-                match = re.search(
-                    r"<maven\.compiler\.source>(\d+(?:\.\d+)*)</maven\.compiler\.source>",
-                    content,
-                )
+                match = _POM_COMPILER_SOURCE_RE.search(content)
                 if match:
                     version = match.group(1)
                     if not _validate_version(version, "java"):
@@ -399,8 +427,7 @@ def parse_java_version(project_path: Path) -> VersionSpec | None:
         content = safe_read_text(build_gradle, project_path)
         if content:
             try:
-                pattern = r"sourceCompatibility\s*=\s*['\"]?(\d+(?:\.\d+)*)['\"]?"
-                match = re.search(pattern, content)
+                match = _GRADLE_SOURCE_COMPAT_RE.search(content)
                 if match:
                     version = match.group(1)
                     if not _validate_version(version, "java"):
@@ -420,17 +447,11 @@ def parse_java_version(project_path: Path) -> VersionSpec | None:
         content = safe_read_text(build_gradle_kts, project_path)
         if content:
             try:
-                # Check for sourceCompatibility
-                pattern = r"sourceCompatibility\s*=\s*JavaVersion\.VERSION_(\d+)"
-                match = re.search(pattern, content)
-                if not match:
-                    # Also check for jvmToolchain
-                    pattern = r"jvmToolchain\s*\(\s*(\d+)\s*\)"
-                    match = re.search(pattern, content)
-                if not match:
-                    # Check for JavaLanguageVersion.of(X) in toolchain config
-                    pattern = r"JavaLanguageVersion\.of\s*\(\s*(\d+)\s*\)"
-                    match = re.search(pattern, content)
+                match = None
+                for pattern in _KTS_JAVA_VERSION_RES:
+                    match = pattern.search(content)
+                    if match:
+                        break
 
                 if match:
                     version = match.group(1)
@@ -475,17 +496,11 @@ def parse_kotlin_version(project_path: Path) -> VersionSpec | None:
         content = safe_read_text(build_gradle_kts, project_path)
         if content:
             try:
-                p1 = r'kotlin\s*\(\s*["\']jvm["\']\s*\)\s+version\s+["\']([^"\']+)["\']'
-                match = re.search(p1, content)
-                if not match:
-                    p2 = (
-                        r'id\s*\(\s*["\']org\.jetbrains\.kotlin\.jvm["\']\s*\)\s+'
-                        r'version\s+["\']([^"\']+)["\']'
-                    )
-                    match = re.search(p2, content)
-                if not match:
-                    p3 = r'kotlin\s*\(["\']jvm["\']\)\s+version\s+["\']([^"\']+)["\']'
-                    match = re.search(p3, content)
+                match = None
+                for pattern in _KOTLIN_PLUGIN_VERSION_RES:
+                    match = pattern.search(content)
+                    if match:
+                        break
 
                 if match:
                     version = _normalize_version(match.group(1))
@@ -528,8 +543,7 @@ def parse_rust_version(project_path: Path) -> VersionSpec | None:
     rust_toolchain_toml = project_path / "rust-toolchain.toml"
     if rust_toolchain_toml.exists() and is_safe_path(rust_toolchain_toml, project_path):
         try:
-            with open(rust_toolchain_toml, "rb") as f:
-                data = tomllib.load(f)
+            data = load_toml(rust_toolchain_toml)
             channel = data.get("toolchain", {}).get("channel")
             if channel:
                 normalized = _normalize_version(channel)
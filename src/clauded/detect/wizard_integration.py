@@ -4,6 +4,7 @@ This module provides modified wizard.run() function that accepts detection resul
 and uses them to pre-populate defaults and pre-check multi-select items.
 """
 
+import re
 from pathlib import Path
 
 import click
@@ -20,6 +21,11 @@ from ..wizard import (
 from . import detect
 from .result import DetectionResult
 
+# Patterns used by normalize_version_for_choice, compiled once at import
+_CONSTRAINT_PREFIX_RE = re.compile(r"^[><=~^]+\s*")
+_MAJOR_RE = re.compile(r"^(\d+)")
+_MAJOR_MINOR_RE = re.compile(r"^(\d+\.\d+)")
+
 
 def run_with_detection(
     project_path: Path,
@@ -352,36 +358,34 @@ def normalize_version_for_choice(
         2. Check if normalized version in choices list
         3. Return matching choice or None
     """
-    import re
-
     try:
         if not version or not choices:
             return None
 
         # Remove constraint operators
-        clean_version = re.sub(r"^[><=~^]+\s*", "", version).strip()
+        clean_version = _CONSTRAINT_PREFIX_RE.sub("", version).strip()
 
         if runtime == "python":
             # Extract major.minor: "3.12.0" → "3.12", "3.12" → "3.12"
-            match = re.match(r"^(\d+\.\d+)", clean_version)
+            match = _MAJOR_MINOR_RE.match(clean_version)
             if match:
                 normalized = match.group(1)
                 return normalized if normalized in choices else None
         elif runtime == "node":
             # Extract major: "20.10.0" → "20"
-            match = re.match(r"^(\d+)", clean_version)
+            match = _MAJOR_RE.match(clean_version)
             if match:
                 normalized = match.group(1)
                 return normalized if normalized in choices else None
         elif runtime == "java":
             # Extract major: "21.0.1" → "21" or "21" → "21"
-            match = re.match(r"^(\d+)", clean_version)
+            match = _MAJOR_RE.match(clean_version)
             if match:
                 normalized = match.group(1)
                 return normalized if normalized in choices else None
         elif runtime == "kotlin":
             # Extract major.minor: "2.0.10" → "2.0"
-            match = re.match(r"^(\d+\.\d+)", clean_version)
+            match = _MAJOR_MINOR_RE.match(clean_version)
             if match:
                 normalized = match.group(1)
                 return normalized if normalized in choices else None
@@ -403,13 +407,11 @@ def normalize_version_for_choice(
             if clean_version in choices:
                 return clean_version
             # Extract major.minor and find matching choice
-            match = re.match(r"^(\d+\.\d+)", clean_version)
+            match = _MAJOR_MINOR_RE.match(clean_version)
             if match:
                 major_minor = match.group(1)
-                # Find choice that starts with this major.minor
-                for choice in choices:
-                    if choice.startswith(major_minor):
-                        return choice
+                # Find the first choice that starts with this major.minor
+                return next((c for c in choices if c.startswith(major_minor)), None)
             return None
 
         return None
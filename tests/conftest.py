@@ -0,0 +1,64 @@
+"""Shared pytest configuration for the clauded test suite."""
+
+import itertools
+import os
+import shutil
+import tempfile
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+from hypothesis import HealthCheck, Phase, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+HYPOTHESIS_DB_DIR = Path(__file__).parent.parent / ".hypothesis-cache"
+
+# Hypothesis profiles (select with HYPOTHESIS_PROFILE=<name>):
+#   ci  - default; fewer examples per property, no explain phase (it re-runs
+#         a failing test many times), and a persisted example database so
+#         known counterexamples are replayed instead of re-searched. On CI
+#         runners (CI is set, as GitHub Actions does) the shrink phase is
+#         skipped as well; a failure there is minimized by re-running locally
+#   dev - Hypothesis' stock settings for thorough local exploration; a few
+#         filesystem-backed properties pin max_examples with @settings and
+#         keep that cap under every profile, dev included
+_CI_PHASES = (Phase.explicit, Phase.reuse, Phase.generate)
+settings.register_profile(
+    "ci",
+    max_examples=25,
+    deadline=None,
+    phases=_CI_PHASES if os.environ.get("CI") else (*_CI_PHASES, Phase.shrink),
+    suppress_health_check=[HealthCheck.too_slow],
+    database=DirectoryBasedExampleDatabase(str(HYPOTHESIS_DB_DIR)),
+)
+settings.register_profile("dev")
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "ci"))
+
+
+@pytest.fixture(scope="session")
+def fast_tmp() -> Iterator[Callable[[], Path]]:
+    """Factory for fresh empty directories under one session-wide root.
+
+    Hypothesis examples need a clean directory each, but a TemporaryDirectory
+    per example pays for creating and tearing down a tree every time. Each call
+    here is a single mkdir; the whole root (on tmpfs when /dev/shm exists) is
+    removed once at session end. Being session-scoped, it is also safe to use
+    from @given tests without the function-scoped-fixture health check. Under
+    pytest-xdist every worker gets its own root, tagged with the worker id.
+    """
+    shm = "/dev/shm"
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    root = Path(
+        tempfile.mkdtemp(
+            prefix=f"clauded-{worker}-", dir=shm if os.path.isdir(shm) else None
+        )
+    )
+    counter = itertools.count()
+
+    def make() -> Path:
+        path = root / f"t{next(counter)}"
+        path.mkdir()
+        return path
+
+    yield make
+    shutil.rmtree(root, ignore_errors=True)
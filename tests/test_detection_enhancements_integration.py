@@ -3,28 +3,45 @@
 Tests the complete detection pipeline with new MongoDB and Micronaut support.
 """
 
-import tempfile
+from collections import defaultdict
 from pathlib import Path
 
-from hypothesis import given
-from hypothesis import strategies as st
+import pytest
 
 from clauded.detect.database import detect_databases
 from clauded.detect.framework import detect_frameworks_and_tools
-
-
-class TestMongoDBDetectionIntegration:
-    """Integration tests for MongoDB detection across all sources."""
-
-    def test_mongodb_docker_compose_integration(self):
-        """Test MongoDB detection from docker-compose integrates with pipeline."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project = Path(tmpdir)
-
-            # Create docker-compose with MongoDB
-            compose_file = project / "docker-compose.yml"
-            compose_file.write_text(
-                """
+from clauded.detect.linguist import detect_languages
+
+# Parametrize inputs, built once at import and shared by the tests below
+_MONGO_IMAGES = ("mongo", "mongodb", "mongo:7.0", "mongodb:latest", "mongo:6.0")
+_MONGO_ENV_VARS = (
+    "MONGODB_URI",
+    "MONGO_URL",
+    "MONGODB_URL",
+    "MONGODB_HOST",
+    "MONGO_HOST",
+)
+_PYTHON_MONGO_ORMS = frozenset({"pymongo", "motor", "mongoengine", "beanie"})
+_MONGO_ORM_PACKAGES = (
+    "pymongo",
+    "motor",
+    "mongoengine",
+    "beanie",
+    "mongoose",
+    "mongodb",
+)
+_MICRONAUT_ARTIFACTS = (
+    "micronaut-core",
+    "micronaut-http",
+    "micronaut-http-server",
+    "micronaut-validation",
+    "micronaut-data",
+    "micronaut-security",
+)
+
+
+# Fixed fixture files, pre-encoded so tests write them without a text layer
+_COMPOSE_MONGO_SERVICE = b"""
 version: '3.8'
 services:
   database:
@@ -32,198 +49,246 @@ services:
     ports:
       - "27017:27017"
 """
-            )
+_PYPROJECT_PYMONGO = b"""
+[project]
+name = "testproject"
+dependencies = ["pymongo>=4.0.0"]
+"""
+_PACKAGE_JSON_MONGOOSE = b"""
+{
+  "name": "testproject",
+  "dependencies": {
+    "mongoose": "^7.0.0"
+  }
+}
+"""
+_COMPOSE_MONGO = b"""
+services:
+  db:
+    image: mongo:7.0
+"""
+_BUILD_GRADLE_MICRONAUT = b"""
+plugins {
+    id 'java'
+}
 
-            # Run complete detection pipeline
-            databases = detect_databases(project)
+dependencies {
+    implementation 'io.micronaut:micronaut-http-server-netty:4.0.0'
+    implementation 'io.micronaut:micronaut-validation:4.0.0'
+}
+"""
+_BUILD_GRADLE_MICRONAUT_MONGODB = b"""
+plugins {
+    id 'java'
+}
 
-            # Verify MongoDB detected with high confidence
-            mongodb_items = [db for db in databases if db.name == "mongodb"]
-            assert len(mongodb_items) == 1
-            assert mongodb_items[0].confidence == "high"
-            assert "docker-compose.yml" in mongodb_items[0].source_file
-            # source_evidence is the service name from docker-compose
-            assert mongodb_items[0].source_evidence == "database"
+dependencies {
+    implementation 'io.micronaut:micronaut-core:4.0.0'
+    implementation 'org.mongodb:mongodb-driver-sync:4.9.0'
+}
+"""
+_PYPROJECT_FASTAPI_PYMONGO = b"""
+[project]
+name = "myproject"
+requires-python = ">=3.10"
+dependencies = [
+    "fastapi>=0.100.0",
+    "pymongo>=4.0.0",
+]
+"""
+_COMPOSE_MONGODB_WEB = b"""
+services:
+  mongodb:
+    image: mongodb:7.0
+  web:
+    build: .
+"""
+_PACKAGE_JSON_EXPRESS_MONGOOSE = b"""
+{
+  "name": "myapp",
+  "engines": {
+    "node": ">=18.0.0"
+  },
+  "dependencies": {
+    "express": "^4.18.0",
+    "mongoose": "^7.0.0"
+  }
+}
+"""
+
+
+@pytest.fixture(scope="module")
+def mongo_compose_project(tmp_path_factory):
+    """Project whose docker-compose.yml runs MongoDB, built once per module."""
+    project = tmp_path_factory.mktemp("mongo_compose")
+    (project / "docker-compose.yml").write_bytes(_COMPOSE_MONGO_SERVICE)
+    return project
 
-    def test_mongodb_env_file_integration(self):
+
+def _by_name(items):
+    """Group detected items by name, preserving detection order."""
+    grouped = defaultdict(list)
+    for item in items:
+        grouped[item.name].append(item)
+    return grouped
+
+
+def _detect_all(project):
+    """Run the database and framework/tool detectors once over a project."""
+    databases = detect_databases(project)
+    frameworks, tools = detect_frameworks_and_tools(project)
+    return databases, frameworks, tools
+
+
+class TestMongoDBDetectionIntegration:
+    """Integration tests for MongoDB detection across all sources."""
+
+    def test_mongodb_docker_compose_integration(self, mongo_compose_project):
+        """Test MongoDB detection from docker-compose integrates with pipeline."""
+        # Run complete detection pipeline
+        databases = detect_databases(mongo_compose_project)
+
+        # Verify MongoDB detected with high confidence
+        mongodb_items = _by_name(databases).get("mongodb", [])
+        assert len(mongodb_items) == 1
+        assert mongodb_items[0].confidence == "high"
+        assert "docker-compose.yml" in mongodb_items[0].source_file
+        # source_evidence is the service name from docker-compose
+        assert mongodb_items[0].source_evidence == "database"
+
+    def test_mongodb_env_file_integration(self, tmp_path):
         """Test MongoDB detection from env files integrates with pipeline."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project = Path(tmpdir)
+        project = tmp_path
 
-            # Create .env.example with MongoDB URI
-            env_file = project / ".env.example"
-            env_file.write_text("MONGODB_URI=mongodb://localhost:27017/mydb\n")
+        # Create .env.example with MongoDB URI
+        env_file = project / ".env.example"
+        env_file.write_bytes(b"MONGODB_URI=mongodb://localhost:27017/mydb\n")
 
-            # Run complete detection pipeline
-            databases = detect_databases(project)
+        # Run complete detection pipeline
+        databases = detect_databases(project)
 
-            # Verify MongoDB detected with low confidence
-            mongodb_items = [db for db in databases if db.name == "mongodb"]
-            assert len(mongodb_items) == 1
-            assert mongodb_items[0].confidence == "low"
-            assert ".env.example" in mongodb_items[0].source_file
-            assert mongodb_items[0].source_evidence == "MONGODB_URI"
+        # Verify MongoDB detected with low confidence
+        mongodb_items = _by_name(databases).get("mongodb", [])
+        assert len(mongodb_items) == 1
+        assert mongodb_items[0].confidence == "low"
+        assert ".env.example" in mongodb_items[0].source_file
+        assert mongodb_items[0].source_evidence == "MONGODB_URI"
 
-    def test_mongodb_orm_python_integration(self):
+    def test_mongodb_orm_python_integration(self, tmp_path):
         """Test MongoDB detection from Python ORM integrates with pipeline."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project = Path(tmpdir)
+        project = tmp_path
 
-            # Create pyproject.toml with pymongo dependency
-            pyproject = project / "pyproject.toml"
-            pyproject.write_text(
-                """
-[project]
-name = "testproject"
-dependencies = ["pymongo>=4.0.0"]
-"""
-            )
+        # Create pyproject.toml with pymongo dependency
+        pyproject = project / "pyproject.toml"
+        pyproject.write_bytes(_PYPROJECT_PYMONGO)
 
-            # Run complete detection pipeline
-            databases = detect_databases(project)
+        # Run complete detection pipeline
+        databases = detect_databases(project)
 
-            # Verify MongoDB detected with medium confidence
-            mongodb_items = [db for db in databases if db.name == "mongodb"]
-            assert len(mongodb_items) == 1
-            assert mongodb_items[0].confidence == "medium"
-            assert "pyproject.toml" in mongodb_items[0].source_file
-            assert mongodb_items[0].source_evidence == "pymongo"
+        # Verify MongoDB detected with medium confidence
+        mongodb_items = _by_name(databases).get("mongodb", [])
+        assert len(mongodb_items) == 1
+        assert mongodb_items[0].confidence == "medium"
+        assert "pyproject.toml" in mongodb_items[0].source_file
+        assert mongodb_items[0].source_evidence == "pymongo"
 
-    def test_mongodb_orm_node_integration(self):
+    def test_mongodb_orm_node_integration(self, tmp_path):
         """Test MongoDB detection from Node.js ORM integrates with pipeline."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project = Path(tmpdir)
+        project = tmp_path
 
-            # Create package.json with mongoose dependency
-            package_json = project / "package.json"
-            package_json.write_text(
-                """
-{
-  "name": "testproject",
-  "dependencies": {
-    "mongoose": "^7.0.0"
-  }
-}
-"""
-            )
+        # Create package.json with mongoose dependency
+        package_json = project / "package.json"
+        package_json.write_bytes(_PACKAGE_JSON_MONGOOSE)
 
-            # Run complete detection pipeline
-            databases = detect_databases(project)
+        # Run complete detection pipeline
+        databases = detect_databases(project)
 
-            # Verify MongoDB detected with medium confidence
-            mongodb_items = [db for db in databases if db.name == "mongodb"]
-            assert len(mongodb_items) == 1
-            assert mongodb_items[0].confidence == "medium"
-            assert "package.json" in mongodb_items[0].source_file
-            assert mongodb_items[0].source_evidence == "mongoose"
+        # Verify MongoDB detected with medium confidence
+        mongodb_items = _by_name(databases).get("mongodb", [])
+        assert len(mongodb_items) == 1
+        assert mongodb_items[0].confidence == "medium"
+        assert "package.json" in mongodb_items[0].source_file
+        assert mongodb_items[0].source_evidence == "mongoose"
 
-    def test_mongodb_multiple_sources_deduplication(self):
+    def test_mongodb_multiple_sources_deduplication(self, tmp_path):
         """Test MongoDB from multiple sources is deduplicated correctly."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project = Path(tmpdir)
+        project = tmp_path
 
-            # Create multiple MongoDB indicators
-            compose_file = project / "docker-compose.yml"
-            compose_file.write_text(
-                """
-services:
-  db:
-    image: mongo:7.0
-"""
-            )
+        # Create multiple MongoDB indicators
+        compose_file = project / "docker-compose.yml"
+        compose_file.write_bytes(_COMPOSE_MONGO)
 
-            env_file = project / ".env.example"
-            env_file.write_text("MONGODB_URI=mongodb://localhost:27017\n")
+        env_file = project / ".env.example"
+        env_file.write_bytes(b"MONGODB_URI=mongodb://localhost:27017\n")
 
-            pyproject = project / "pyproject.toml"
-            pyproject.write_text(
-                """
-[project]
-name = "test"
-dependencies = ["pymongo>=4.0.0"]
-"""
-            )
+        pyproject = project / "pyproject.toml"
+        pyproject.write_bytes(_PYPROJECT_PYMONGO)
 
-            # Run complete detection pipeline
-            databases = detect_databases(project)
+        # Run complete detection pipeline
+        databases = detect_databases(project)
 
-            # Verify MongoDB appears exactly once (deduplicated)
-            mongodb_items = [db for db in databases if db.name == "mongodb"]
-            assert len(mongodb_items) == 1
+        # Verify MongoDB appears exactly once (deduplicated)
+        mongodb_items = _by_name(databases).get("mongodb", [])
+        assert len(mongodb_items) == 1
 
-            # Verify highest confidence is kept (high from docker-compose)
-            assert mongodb_items[0].confidence == "high"
+        # Verify highest confidence is kept (high from docker-compose)
+        assert mongodb_items[0].confidence == "high"
 
-    @given(
-        mongodb_image=st.sampled_from(
-            ["mongo", "mongodb", "mongo:7.0", "mongodb:latest", "mongo:6.0"]
-        )
-    )
-    def test_mongodb_docker_images_property(self, mongodb_image):
+    @pytest.mark.parametrize("mongodb_image", _MONGO_IMAGES)
+    def test_mongodb_docker_images_property(self, tmp_path, mongodb_image):
         """Property: All MongoDB image variants are detected."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project = Path(tmpdir)
+        project = tmp_path
 
-            compose_file = project / "docker-compose.yml"
-            compose_file.write_text(
-                f"""
+        compose_file = project / "docker-compose.yml"
+        compose_file.write_text(
+            f"""
 services:
   db:
     image: {mongodb_image}
 """
-            )
+        )
 
-            databases = detect_databases(project)
-            mongodb_items = [db for db in databases if db.name == "mongodb"]
+        databases = detect_databases(project)
+        mongodb_items = _by_name(databases).get("mongodb", [])
 
-            # Property: MongoDB is detected from any valid mongo image
-            assert len(mongodb_items) >= 1
+        # Property: MongoDB is detected from any valid mongo image
+        assert len(mongodb_items) >= 1
 
-    @given(
-        env_var_name=st.sampled_from(
-            ["MONGODB_URI", "MONGO_URL", "MONGODB_URL", "MONGODB_HOST", "MONGO_HOST"]
-        )
-    )
-    def test_mongodb_env_vars_property(self, env_var_name):
+    @pytest.mark.parametrize("env_var_name", _MONGO_ENV_VARS)
+    def test_mongodb_env_vars_property(self, tmp_path, env_var_name):
         """Property: All MongoDB env var patterns are detected."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project = Path(tmpdir)
+        project = tmp_path
 
-            env_file = project / ".env.example"
-            env_file.write_text(f"{env_var_name}=mongodb://localhost:27017\n")
+        env_file = project / ".env.example"
+        env_file.write_text(f"{env_var_name}=mongodb://localhost:27017\n")
 
-            databases = detect_databases(project)
-            mongodb_items = [db for db in databases if db.name == "mongodb"]
+        databases = detect_databases(project)
+        mongodb_items = _by_name(databases).get("mongodb", [])
 
-            # Property: MongoDB is detected from any valid env var name
-            assert len(mongodb_items) >= 1
-            assert mongodb_items[0].source_evidence == env_var_name
+        # Property: MongoDB is detected from any valid env var name
+        assert len(mongodb_items) >= 1
+        assert mongodb_items[0].source_evidence == env_var_name
 
-    @given(
-        orm_package=st.sampled_from(
-            ["pymongo", "motor", "mongoengine", "beanie", "mongoose", "mongodb"]
-        )
-    )
-    def test_mongodb_orm_packages_property(self, orm_package):
+    @pytest.mark.parametrize("orm_package", _MONGO_ORM_PACKAGES)
+    def test_mongodb_orm_packages_property(self, tmp_path, orm_package):
         """Property: All MongoDB ORM packages are detected."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project = Path(tmpdir)
-
-            # Test Python packages
-            if orm_package in ["pymongo", "motor", "mongoengine", "beanie"]:
-                pyproject = project / "pyproject.toml"
-                pyproject.write_text(
-                    f"""
+        project = tmp_path
+
+        # Test Python packages
+        if orm_package in _PYTHON_MONGO_ORMS:
+            pyproject = project / "pyproject.toml"
+            pyproject.write_text(
+                f"""
 [project]
 name = "test"
 dependencies = ["{orm_package}>=1.0.0"]
 """
-                )
-            # Test Node packages
-            else:
-                package_json = project / "package.json"
-                package_json.write_text(
-                    f"""
+            )
+        # Test Node packages
+        else:
+            package_json = project / "package.json"
+            package_json.write_text(
+                f"""
 {{
   "name": "test",
   "dependencies": {{
@@ -231,204 +296,170 @@ dependencies = ["{orm_package}>=1.0.0"]
   }}
 }}
 """
-                )
+            )
 
-            databases = detect_databases(project)
-            mongodb_items = [db for db in databases if db.name == "mongodb"]
+        databases = detect_databases(project)
+        mongodb_items = _by_name(databases).get("mongodb", [])
 
-            # Property: MongoDB is detected from any valid ORM package
-            assert len(mongodb_items) >= 1
-            assert mongodb_items[0].source_evidence == orm_package
+        # Property: MongoDB is detected from any valid ORM package
+        assert len(mongodb_items) >= 1
+        assert mongodb_items[0].source_evidence == orm_package
 
 
 class TestMicronautFrameworkIntegration:
     """Integration tests for Micronaut framework detection."""
 
-    def test_micronaut_build_gradle_integration(self):
+    def test_micronaut_build_gradle_integration(self, tmp_path):
         """Test Micronaut detection from build.gradle integrates with pipeline."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project = Path(tmpdir)
+        project = tmp_path
 
-            # Create build.gradle with Micronaut dependencies
-            build_gradle = project / "build.gradle"
-            build_gradle.write_text(
-                """
-plugins {
-    id 'java'
-}
+        # Create build.gradle with Micronaut dependencies
+        build_gradle = project / "build.gradle"
+        build_gradle.write_bytes(_BUILD_GRADLE_MICRONAUT)
 
-dependencies {
-    implementation 'io.micronaut:micronaut-http-server-netty:4.0.0'
-    implementation 'io.micronaut:micronaut-validation:4.0.0'
-}
-"""
-            )
+        # Run complete detection pipeline
+        frameworks, tools = detect_frameworks_and_tools(project)
 
-            # Run complete detection pipeline
-            frameworks, tools = detect_frameworks_and_tools(project)
-
-            # Verify Micronaut detected
-            micronaut_items = [fw for fw in frameworks if fw.name == "micronaut"]
-            assert len(micronaut_items) >= 1
-            assert micronaut_items[0].confidence == "high"
-            assert "build.gradle" in micronaut_items[0].source_file
-
-    @given(
-        micronaut_artifact=st.sampled_from(
-            [
-                "micronaut-core",
-                "micronaut-http",
-                "micronaut-http-server",
-                "micronaut-validation",
-                "micronaut-data",
-                "micronaut-security",
-            ]
-        )
-    )
-    def test_micronaut_artifacts_property(self, micronaut_artifact):
+        # Verify Micronaut detected
+        micronaut_items = _by_name(frameworks).get("micronaut", [])
+        assert len(micronaut_items) >= 1
+        assert micronaut_items[0].confidence == "high"
+        assert "build.gradle" in micronaut_items[0].source_file
+
+    @pytest.mark.parametrize("micronaut_artifact", _MICRONAUT_ARTIFACTS)
+    def test_micronaut_artifacts_property(self, tmp_path, micronaut_artifact):
         """Property: All Micronaut artifacts are detected."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project = Path(tmpdir)
+        project = tmp_path
 
-            build_gradle = project / "build.gradle"
-            build_gradle.write_text(
-                f"""
+        build_gradle = project / "build.gradle"
+        build_gradle.write_text(
+            f"""
 dependencies {{
     implementation 'io.micronaut:{micronaut_artifact}:4.0.0'
 }}
 """
-            )
+        )
 
-            frameworks, _ = detect_frameworks_and_tools(project)
-            micronaut_items = [fw for fw in frameworks if fw.name == "micronaut"]
+        frameworks, _ = detect_frameworks_and_tools(project)
+        micronaut_items = _by_name(frameworks).get("micronaut", [])
 
-            # Property: Micronaut is detected from any valid artifact
-            assert len(micronaut_items) >= 1
+        # Property: Micronaut is detected from any valid artifact
+        assert len(micronaut_items) >= 1
 
 
 class TestCompleteDetectionPipeline:
     """Integration tests for the complete detection enhancement pipeline."""
 
-    def test_full_java_project_detection(self):
+    def test_full_java_project_detection(self, tmp_path):
         """Test detection pipeline on Java project with MongoDB and Micronaut."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project = Path(tmpdir)
-
-            # Create complete Java project structure
-            build_gradle = project / "build.gradle"
-            build_gradle.write_text(
-                """
-plugins {
-    id 'java'
-}
+        project = tmp_path
 
-dependencies {
-    implementation 'io.micronaut:micronaut-core:4.0.0'
-    implementation 'org.mongodb:mongodb-driver-sync:4.9.0'
-}
-"""
-            )
+        # Create complete Java project structure
+        build_gradle = project / "build.gradle"
+        build_gradle.write_bytes(_BUILD_GRADLE_MICRONAUT_MONGODB)
 
-            compose_file = project / "docker-compose.yml"
-            compose_file.write_text(
-                """
-services:
-  db:
-    image: mongo:7.0
-"""
-            )
+        compose_file = project / "docker-compose.yml"
+        compose_file.write_bytes(_COMPOSE_MONGO)
 
-            env_file = project / ".env.example"
-            env_file.write_text("MONGODB_URI=mongodb://localhost:27017/mydb\n")
+        env_file = project / ".env.example"
+        env_file.write_bytes(b"MONGODB_URI=mongodb://localhost:27017/mydb\n")
 
-            # Run complete detection pipeline
-            databases = detect_databases(project)
-            frameworks, tools = detect_frameworks_and_tools(project)
+        # Run complete detection pipeline
+        databases, frameworks, tools = _detect_all(project)
 
-            # Verify MongoDB detected (deduplicated from multiple sources)
-            mongodb_items = [db for db in databases if db.name == "mongodb"]
-            assert len(mongodb_items) == 1
-            assert mongodb_items[0].confidence == "high"  # Highest confidence wins
+        # Verify MongoDB detected (deduplicated from multiple sources)
+        mongodb_items = _by_name(databases).get("mongodb", [])
+        assert len(mongodb_items) == 1
+        assert mongodb_items[0].confidence == "high"  # Highest confidence wins
 
-            # Verify Micronaut detected
-            micronaut_items = [fw for fw in frameworks if fw.name == "micronaut"]
-            assert len(micronaut_items) >= 1
+        # Verify Micronaut detected
+        micronaut_items = _by_name(frameworks).get("micronaut", [])
+        assert len(micronaut_items) >= 1
 
-    def test_full_python_project_detection(self):
+    def test_full_python_project_detection(self, tmp_path):
         """Test complete detection pipeline on Python project with MongoDB."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project = Path(tmpdir)
+        project = tmp_path
 
-            # Create Python project with MongoDB
-            pyproject = project / "pyproject.toml"
-            pyproject.write_text(
-                """
-[project]
-name = "myproject"
-requires-python = ">=3.10"
-dependencies = [
-    "fastapi>=0.100.0",
-    "pymongo>=4.0.0",
-]
-"""
-            )
+        # Create Python project with MongoDB
+        pyproject = project / "pyproject.toml"
+        pyproject.write_bytes(_PYPROJECT_FASTAPI_PYMONGO)
 
-            compose_file = project / "docker-compose.yml"
-            compose_file.write_text(
-                """
-services:
-  mongodb:
-    image: mongodb:7.0
-  web:
-    build: .
-"""
-            )
+        compose_file = project / "docker-compose.yml"
+        compose_file.write_bytes(_COMPOSE_MONGODB_WEB)
 
-            # Run complete detection pipeline
-            databases = detect_databases(project)
-            frameworks, _ = detect_frameworks_and_tools(project)
+        # Run complete detection pipeline
+        databases, frameworks, _ = _detect_all(project)
 
-            # Verify MongoDB detected and deduplicated
-            mongodb_items = [db for db in databases if db.name == "mongodb"]
-            assert len(mongodb_items) == 1
+        # Verify MongoDB detected and deduplicated
+        mongodb_items = _by_name(databases).get("mongodb", [])
+        assert len(mongodb_items) == 1
 
-            # Verify FastAPI detected
-            fastapi_items = [fw for fw in frameworks if fw.name == "fastapi"]
-            assert len(fastapi_items) >= 1
+        # Verify FastAPI detected
+        fastapi_items = _by_name(frameworks).get("fastapi", [])
+        assert len(fastapi_items) >= 1
 
-    def test_full_node_project_detection(self):
+    def test_full_node_project_detection(self, tmp_path):
         """Test complete detection pipeline on Node.js project with MongoDB."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            project = Path(tmpdir)
+        project = tmp_path
 
-            # Create Node.js project with MongoDB
-            package_json = project / "package.json"
-            package_json.write_text(
-                """
-{
-  "name": "myapp",
-  "engines": {
-    "node": ">=18.0.0"
-  },
-  "dependencies": {
-    "express": "^4.18.0",
-    "mongoose": "^7.0.0"
-  }
-}
-"""
-            )
+        # Create Node.js project with MongoDB
+        package_json = project / "package.json"
+        package_json.write_bytes(_PACKAGE_JSON_EXPRESS_MONGOOSE)
+
+        env_file = project / ".env.example"
+        env_file.write_bytes(b"MONGO_URL=mongodb+srv://cluster.mongodb.net/mydb\n")
+
+        # Run complete detection pipeline
+        databases, frameworks, _ = _detect_all(project)
+
+        # Verify MongoDB detected from multiple sources
+        mongodb_items = _by_name(databases).get("mongodb", [])
+        assert len(mongodb_items) == 1
+
+        # Verify Express detected
+        express_items = _by_name(frameworks).get("express", [])
+        assert len(express_items) >= 1
+
+    def test_vendored_packages_not_scanned(self, tmp_path):
+        """Test vendored node_modules manifests and sources are never scanned."""
+        project = tmp_path
+
+        (project / "package.json").write_bytes(
+            b'{"name": "myapp", "dependencies": {"express": "^4.18.0"}}\n'
+        )
+        vendored = project / "node_modules" / "mongoose"
+        vendored.mkdir(parents=True)
+        (vendored / "package.json").write_bytes(
+            b'{"name": "mongoose", "dependencies": {"mongodb": "^6.0.0"}}\n'
+        )
+        (vendored / "index.js").write_bytes(b"module.exports = {};\n" * 50)
+
+        databases, frameworks, _ = _detect_all(project)
+        scan_stats: dict[str, int] = {}
+        languages = detect_languages(project, scan_stats=scan_stats)
+
+        assert [fw.name for fw in frameworks] == ["express"]
+        assert "mongodb" not in _by_name(databases)
+        assert all(
+            "node_modules" not in Path(source_file).relative_to(project).parts
+            for lang in languages
+            for source_file in lang.source_files
+        )
+        # node_modules is pruned, but its two files still count as excluded
+        assert scan_stats["files_excluded"] == 2
+        assert scan_stats["files_scanned"] == 1
 
-            env_file = project / ".env.example"
-            env_file.write_text("MONGO_URL=mongodb+srv://cluster.mongodb.net/mydb\n")
+    def test_files_named_like_skip_directories_not_scanned(self, tmp_path):
+        """Test .env files and build scripts are excluded, not detected."""
+        project = tmp_path
 
-            # Run complete detection pipeline
-            databases = detect_databases(project)
-            frameworks, _ = detect_frameworks_and_tools(project)
+        (project / "main.py").write_text("print('hello')\n")
+        (project / ".env").write_text("DATABASE_URL=postgres://localhost/app\n")
+        (project / "build").write_text("#!/bin/sh\nmake all\n")
 
-            # Verify MongoDB detected from multiple sources
-            mongodb_items = [db for db in databases if db.name == "mongodb"]
-            assert len(mongodb_items) == 1
+        scan_stats: dict[str, int] = {}
+        languages = detect_languages(project, scan_stats=scan_stats)
 
-            # Verify Express detected
-            express_items = [fw for fw in frameworks if fw.name == "express"]
-            assert len(express_items) >= 1
+        assert [lang.name for lang in languages] == ["Python"]
+        assert scan_stats["files_excluded"] == 2
+        assert scan_stats["files_scanned"] == 1
@@ -15,126 +15,113 @@ from clauded.detect.framework import detect_frameworks_and_tools
 from clauded.detect.utils import safe_read_text
 from clauded.detect.version import parse_java_version, parse_python_version
 
+# Manifests that would be detected if read, placed outside the project
+_EXTERNAL_MANIFESTS = {
+    "setup.py": 'setup(name="malicious", python_requires=">=3.10")',
+    "build.gradle.kts": """
+java {
+    sourceCompatibility = JavaVersion.VERSION_17
+}
+""",
+    "build.gradle": """
+dependencies {
+    implementation 'io.ktor:ktor-server-core:2.0.0'
+}
+""",
+    "docker-compose.yml": """
+services:
+  db:
+    image: mongo:7.0
+""",
+}
 
-class TestSymlinkProtection:
-    """Security tests for symlink traversal protection (SEC-001)."""
 
-    def test_setup_py_rejects_symlink(self, tmp_path: Path) -> None:
-        """setup.py parser must reject symlinked files (SEC-001)."""
-        project_dir = tmp_path / "project"
-        project_dir.mkdir()
-        external_dir = tmp_path / "external"
-        external_dir.mkdir()
+@pytest.fixture(scope="module")
+def symlinked_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Project whose manifests are all symlinks to files outside it.
 
-        # Create malicious setup.py outside project
-        external_setup = external_dir / "setup.py"
-        external_setup.write_text('setup(name="malicious", python_requires=">=3.10")')
+    Built once per module; the symlink tests only run detectors over it.
+    """
+    root = tmp_path_factory.mktemp("symlinks")
+    project_dir = root / "project"
+    project_dir.mkdir()
+    external_dir = root / "external"
+    external_dir.mkdir()
 
-        # Create symlink inside project pointing to external file
-        symlink_setup = project_dir / "setup.py"
+    for name, content in _EXTERNAL_MANIFESTS.items():
+        external_file = external_dir / name
+        external_file.write_text(content)
         try:
-            symlink_setup.symlink_to(external_setup)
+            (project_dir / name).symlink_to(external_file)
         except OSError:
             pytest.skip("Symlink creation not supported on this platform")
 
-        # Attempt to detect version - should NOT read symlinked file
-        spec = parse_python_version(project_dir)
+    return project_dir
 
-        # Should return None (symlink rejected)
-        assert spec is None
 
-    def test_build_gradle_kts_rejects_symlink(self, tmp_path: Path) -> None:
-        """build.gradle.kts parser must reject symlinked files (SEC-001)."""
-        project_dir = tmp_path / "project"
-        project_dir.mkdir()
-        external_dir = tmp_path / "external"
-        external_dir.mkdir()
+class TestSymlinkProtection:
+    """Security tests for symlink traversal protection (SEC-001)."""
 
-        # Create malicious build.gradle.kts outside project
-        external_gradle = external_dir / "build.gradle.kts"
-        external_gradle.write_text(
-            """
-java {
-    sourceCompatibility = JavaVersion.VERSION_17
-}
-"""
-        )
+    def test_setup_py_rejects_symlink(self, symlinked_project: Path) -> None:
+        """setup.py parser must reject symlinked files (SEC-001)."""
+        # Attempt to detect version - should NOT read symlinked setup.py
+        spec = parse_python_version(symlinked_project)
 
-        # Create symlink inside project
-        symlink_gradle = project_dir / "build.gradle.kts"
-        try:
-            symlink_gradle.symlink_to(external_gradle)
-        except OSError:
-            pytest.skip("Symlink creation not supported on this platform")
+        # Should return None (symlink rejected)
+        assert spec is None
 
-        # Attempt to detect version - should NOT read symlinked file
-        spec = parse_java_version(project_dir)
+    def test_build_gradle_kts_rejects_symlink(self, symlinked_project: Path) -> None:
+        """build.gradle.kts parser must reject symlinked files (SEC-001)."""
+        # Attempt to detect version - should NOT read symlinked build files
+        spec = parse_java_version(symlinked_project)
 
         # Should return None (symlink rejected)
         assert spec is None
 
-    def test_build_gradle_rejects_symlink(self, tmp_path: Path) -> None:
+    def test_build_gradle_rejects_symlink(self, symlinked_project: Path) -> None:
         """build.gradle parser must reject symlinked files (SEC-001)."""
-        project_dir = tmp_path / "project"
-        project_dir.mkdir()
-        external_dir = tmp_path / "external"
-        external_dir.mkdir()
-
-        # Create malicious build.gradle outside project
-        external_gradle = external_dir / "build.gradle"
-        external_gradle.write_text(
-            """
-dependencies {
-    implementation 'io.ktor:ktor-server-core:2.0.0'
-}
-"""
-        )
-
-        # Create symlink inside project
-        symlink_gradle = project_dir / "build.gradle"
-        try:
-            symlink_gradle.symlink_to(external_gradle)
-        except OSError:
-            pytest.skip("Symlink creation not supported on this platform")
-
         # Attempt to detect frameworks - should NOT read symlinked file
-        frameworks, _ = detect_frameworks_and_tools(project_dir)
+        frameworks, _ = detect_frameworks_and_tools(symlinked_project)
 
         # Should not detect any frameworks (symlink rejected)
         ktor_items = [fw for fw in frameworks if fw.name == "ktor"]
         assert len(ktor_items) == 0
 
-    def test_docker_compose_rejects_symlink(self, tmp_path: Path) -> None:
+    def test_docker_compose_rejects_symlink(self, symlinked_project: Path) -> None:
         """docker-compose parser must reject symlinked files (SEC-001)."""
-        project_dir = tmp_path / "project"
-        project_dir.mkdir()
-        external_dir = tmp_path / "external"
-        external_dir.mkdir()
-
-        # Create malicious docker-compose.yml outside project
-        external_compose = external_dir / "docker-compose.yml"
-        external_compose.write_text(
-            """
-services:
-  db:
-    image: mongo:7.0
-"""
-        )
-
-        # Create symlink inside project
-        symlink_compose = project_dir / "docker-compose.yml"
-        try:
-            symlink_compose.symlink_to(external_compose)
-        except OSError:
-            pytest.skip("Symlink creation not supported on this platform")
-
         # Attempt to detect databases - should NOT read symlinked file
-        databases = detect_databases(project_dir)
+        databases = detect_databases(symlinked_project)
 
         # Should not detect MongoDB (symlink rejected)
         mongodb_items = [db for db in databases if db.name == "mongodb"]
         assert len(mongodb_items) == 0
 
+    def test_relative_project_root_tracks_working_directory(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A relative project root is resolved against the current directory."""
+        for name in ("first", "second"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "notes.txt").write_text(name)
+
+        monkeypatch.chdir(tmp_path / "first")
+        assert safe_read_text(Path("notes.txt"), Path(".")) == "first"
+
+        monkeypatch.chdir(tmp_path / "second")
+        assert safe_read_text(Path("notes.txt"), Path(".")) == "second"
+
+    def test_symlinked_project_root_is_resolved(self, tmp_path: Path) -> None:
+        """A root reached through a directory symlink still bounds its files."""
+        real_root = tmp_path / "real"
+        real_root.mkdir()
+        (real_root / "notes.txt").write_text("inside")
+        (tmp_path / "outside.txt").write_text("outside")
+        linked_root = tmp_path / "linked"
+        linked_root.symlink_to(real_root, target_is_directory=True)
+
+        assert safe_read_text(linked_root / "notes.txt", linked_root) == "inside"
+        assert safe_read_text(linked_root / ".." / "outside.txt", linked_root) is None
+
 
 class TestVersionInjectionPrevention:
     """Security tests for version string validation (SEC-002)."""
@@ -182,6 +169,19 @@ setup(
             assert "|" not in spec.version
             assert ".." not in spec.version
 
+    def test_setup_py_rejects_non_ascii_digits(self, tmp_path: Path) -> None:
+        """Version whitelist accepts ASCII digits only (SEC-002)."""
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+
+        # Arabic-Indic digits for ">=3.12": a Unicode-aware \d would accept it
+        (project_dir / "setup.py").write_text(
+            'setup(name="test", python_requires=">=\u0663.\u0661\u0662")\n',
+            encoding="utf-8",
+        )
+
+        assert parse_python_version(project_dir) is None
+
     @pytest.mark.parametrize(
         "malicious_version",
         [
@@ -334,6 +334,32 @@ dependencies {
         assert len(content) == 5
         assert content == "Hello"
 
+    def test_safe_read_text_limit_counts_bytes(self, tmp_path: Path) -> None:
+        """safe_read_text() caps bytes, dropping a sequence split by the cap."""
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+
+        # Two-byte UTF-8 characters: 10000 bytes on disk
+        test_file = project_dir / "accents.txt"
+        test_file.write_text("\u00e9" * 5000, encoding="utf-8")
+
+        # 8192 bytes hold exactly 4096 characters
+        assert safe_read_text(test_file, project_dir) == "\u00e9" * 4096
+        # An odd cap splits the last character, which is left out
+        assert safe_read_text(test_file, project_dir, limit=8191) == "\u00e9" * 4095
+
+    def test_safe_read_text_translates_newlines(self, tmp_path: Path) -> None:
+        """safe_read_text() decodes like text-mode open() (universal newlines)."""
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+
+        test_file = project_dir / "crlf.txt"
+        test_file.write_bytes(b"python 3.12\r\nnodejs 20\r")
+
+        content = safe_read_text(test_file, project_dir)
+
+        assert content == "python 3.12\nnodejs 20\n"
+
 
 class TestMongoDBDetectionSecurity:
     """Security tests specific to MongoDB detection."""
@@ -36,6 +36,7 @@ from clauded.detect.framework import (
     parse_rust_dependencies,
 )
 from clauded.detect.result import DetectedItem
+from clauded.detect.utils import load_toml
 
 # Supported framework and tool names (frameworks only, not build tools)
 PYTHON_FRAMEWORKS = {"django", "flask", "fastapi"}
@@ -241,6 +242,19 @@ dependencies = ["django>=4.0", "flask>=2.0"]
         for item in items:
             assert item.name in PYTHON_FRAMEWORKS
 
+    def test_cached_pyproject_parse_is_not_shared(self, temp_project_dir: Path) -> None:
+        """Mutating one load_toml result does not leak into the next caller."""
+        pyproject = temp_project_dir / "pyproject.toml"
+        pyproject.write_text("""
+[project]
+dependencies = ["django>=4.0"]
+""")
+        load_toml(pyproject)["project"]["dependencies"].clear()
+
+        items = parse_python_dependencies(temp_project_dir)
+
+        assert [item.name for item in items] == ["django"]
+
 
 # Parameterized Node framework detection tests
 class TestParseNodeDependencies:
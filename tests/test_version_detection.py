@@ -577,3 +577,17 @@ class TestEdgeCases:
 
             assert spec is not None
             assert spec.version == "1.21"
+
+    def test_pyproject_edit_is_picked_up_on_reparse(self) -> None:
+        """Editing pyproject.toml between calls yields the new version."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            project_path = Path(tmpdir)
+            pyproject = project_path / "pyproject.toml"
+            pyproject.write_text('[project]\nrequires-python = ">=3.11"\n')
+            first = parse_python_version(project_path)
+
+            pyproject.write_text('[project]\nrequires-python = ">=3.12"\n')
+            second = parse_python_version(project_path)
+
+            assert first is not None and first.version == ">=3.11"
+            assert second is not None and second.version == ">=3.12"